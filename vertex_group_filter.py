@@ -15,6 +15,7 @@ bl_info = {
 }
 
 import re
+from contextlib import contextmanager
 
 import bpy
 import bmesh
@@ -24,10 +25,44 @@ from bpy.types import PropertyGroup, Operator, Panel, UIList
 # -------------------------------------------------------------
 # ITEM STRUCTURE
 # -------------------------------------------------------------
+
+# Set while operators change ``selected`` themselves and select in bulk
+_item_updates_paused = False
+
+
+@contextmanager
+def _paused_item_updates():
+    """Skip the per-item selection update while the block runs."""
+    global _item_updates_paused
+    _item_updates_paused = True
+    try:
+        yield
+    finally:
+        _item_updates_paused = False
+
+
+def _on_item_selected(self, context):
+    """Select or deselect the item's vertices when its list toggle changes."""
+    if _item_updates_paused:
+        return
+
+    obj = context.object
+    if obj is None or obj.type != "MESH" or context.mode != "EDIT_MESH":
+        return
+
+    obj.vertex_groups.active_index = self.group_index
+    _select_group_vertices(obj, (self.group_index,), select=self.selected)
+
+    # path_from_id() ends in "filtered_groups[<index>]"; remember the row so
+    # vgfilter.toggle can extend a shift selection from it
+    props = context.scene.vgfilter_props
+    props.last_clicked_index = int(self.path_from_id().rpartition("[")[2].rstrip("]"))
+
+
 class VGFILTER_Item(PropertyGroup):
     name: bpy.props.StringProperty()
     group_index: bpy.props.IntProperty()
-    selected: bpy.props.BoolProperty(default=False)
+    selected: bpy.props.BoolProperty(default=False, update=_on_item_selected)
 
 
 # -------------------------------------------------------------
@@ -76,15 +111,56 @@ def _require_edit_mesh(context):
     return obj, None
 
 
-def _preserve_mode(obj):
-    """Return the current mode and helper to restore it."""
-    start_mode = obj.mode if obj is not None else None
+def _replace_ascii_ignore_case(name, search_lower, replacement):
+    """Case-insensitively replace ``search_lower`` in an ASCII ``name``.
+
+    Returns the new name and the number of replacements, like ``re.subn``.
+    """
+    lower_name = name.lower()
+    search_len = len(search_lower)
 
-    def restore():
-        if start_mode and obj.mode != start_mode:
-            bpy.ops.object.mode_set(mode=start_mode)
+    parts = []
+    start = 0
+    count = 0
+    while True:
+        found = lower_name.find(search_lower, start)
+        if found < 0:
+            break
+        parts.append(name[start:found])
+        parts.append(replacement)
+        start = found + search_len
+        count += 1
 
-    return start_mode, restore
+    if count == 0:
+        return name, 0
+
+    parts.append(name[start:])
+    return "".join(parts), count
+
+
+def _select_group_vertices(obj, group_indices, select=True):
+    """Select or deselect visible vertices assigned to any of ``group_indices``.
+
+    Works directly on the edit BMesh in a single pass, so no mode switch or
+    per-group operator call is needed.
+    """
+    wanted = set(group_indices)
+    if not wanted:
+        return
+
+    bm = bmesh.from_edit_mesh(obj.data)
+    deform_layer = bm.verts.layers.deform.active
+    if deform_layer is None:
+        return
+
+    for v in bm.verts:
+        if v.hide:
+            continue
+        if not wanted.isdisjoint(v[deform_layer].keys()):
+            v.select = select
+
+    bm.select_flush(select)
+    bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
 
 def _clean_vertex_groups(obj, keep_name=None, limit_to=None):
@@ -92,7 +168,7 @@ def _clean_vertex_groups(obj, keep_name=None, limit_to=None):
 
     If keep_name is provided, all groups with a different name are removed.
     Otherwise, any group with no assigned vertices is removed, optionally
-    limited to names in ``limit_to``.
+    limited to names in ``limit_to``, a frozenset built once by the caller.
     """
 
     if obj is None or obj.type != "MESH":
@@ -107,19 +183,24 @@ def _clean_vertex_groups(obj, keep_name=None, limit_to=None):
                 obj.vertex_groups.remove(vg)
         return
 
-    # Remove unused groups based on vertex weights
+    # Remove unused groups based on vertex weights. Reading the deform layer
+    # through BMesh avoids the per-weight RNA lookups of ``v.groups``.
     used_indices = set()
-    for v in obj.data.vertices:
-        for g in v.groups:
-            used_indices.add(g.group)
-
-    allowed_names = set(limit_to) if limit_to else None
+    bm = bmesh.new()
+    try:
+        bm.from_mesh(obj.data)
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is not None:
+            for v in bm.verts:
+                used_indices.update(v[deform_layer].keys())
+    finally:
+        bm.free()
 
     for vg in list(obj.vertex_groups):
         if vg.index in used_indices:
             continue
 
-        if allowed_names is not None and vg.name not in allowed_names:
+        if limit_to is not None and vg.name not in limit_to:
             continue
 
         obj.vertex_groups.remove(vg)
@@ -141,22 +222,33 @@ class VGFILTER_OT_Filter(Operator):
     def execute(self, context):
         obj = context.object
         props = context.scene.vgfilter_props
+        vgroups = obj.vertex_groups
+        items = props.filtered_groups
 
-        props.filtered_groups.clear()
+        items.clear()
 
         filter_text = props.filter_text.strip().lower()
         if not filter_text:
             # Include all groups when filter empty
-            candidates = obj.vertex_groups
+            candidates = vgroups
         else:
-            candidates = [vg for vg in obj.vertex_groups if filter_text in vg.name.lower()]
-
-        for i, vg in enumerate(candidates):
-            item = props.filtered_groups.add()
+            filter_len = len(filter_text)
+            candidates = []
+            for vg in vgroups:
+                lower_name = vg.name.lower()
+                # Names shorter than the filter can never contain it
+                if len(lower_name) < filter_len:
+                    continue
+                if lower_name.find(filter_text) != -1:
+                    candidates.append(vg)
+
+        # New items already default to unselected, so only set name and index
+        add_item = items.add
+        for vg in candidates:
+            item = add_item()
             item.name = vg.name
             # Need original index to re-activate correctly
-            item.group_index = obj.vertex_groups[vg.name].index
-            item.selected = False
+            item.group_index = vg.index
 
         props.active_index = 0
         props.last_clicked_index = -1
@@ -190,7 +282,10 @@ class VGFILTER_OT_ToggleSelect(Operator):
             self.report({'WARNING'}, error)
             return {'CANCELLED'}
 
-        if self.item_index < 0 or self.item_index >= len(props.filtered_groups):
+        vgroups = obj.vertex_groups
+        items = props.filtered_groups
+
+        if self.item_index < 0 or self.item_index >= len(items):
             return {'CANCELLED'}
 
         range_select = self.shift_select and props.last_clicked_index >= 0
@@ -201,27 +296,27 @@ class VGFILTER_OT_ToggleSelect(Operator):
             end = max(props.last_clicked_index, self.item_index)
             target_indices = list(range(start, end + 1))
 
-        start_mode, restore_mode = _preserve_mode(obj)
+        selected_groups = []
+        deselected_groups = []
 
-        for idx in target_indices:
-            item = props.filtered_groups[idx]
-            desired_state = True if range_select else not item.selected
+        with _paused_item_updates():
+            for idx in target_indices:
+                item = items[idx]
+                desired_state = True if range_select else not item.selected
 
-            if desired_state == item.selected:
-                continue
-
-            item.selected = desired_state
-            obj.vertex_groups.active_index = item.group_index
+                if desired_state == item.selected:
+                    continue
 
-            if desired_state:
-                bpy.ops.object.vertex_group_select()
-            else:
-                bpy.ops.object.vertex_group_deselect()
+                item.selected = desired_state
+                vgroups.active_index = item.group_index
 
-        if start_mode:
-            bpy.ops.object.mode_set(mode=start_mode)
+                if desired_state:
+                    selected_groups.append(item.group_index)
+                else:
+                    deselected_groups.append(item.group_index)
 
-        restore_mode()
+        _select_group_vertices(obj, selected_groups, select=True)
+        _select_group_vertices(obj, deselected_groups, select=False)
 
         # Remember the last clicked index for future shift selections
         props.last_clicked_index = self.item_index
@@ -248,18 +343,18 @@ class VGFILTER_OT_SelectAll(Operator):
             self.report({'WARNING'}, error)
             return {'CANCELLED'}
 
-        start_mode, restore_mode = _preserve_mode(obj)
+        items = props.filtered_groups
         bpy.ops.mesh.select_all(action="DESELECT")
 
-        for item in props.filtered_groups:
-            item.selected = True
-            obj.vertex_groups.active_index = item.group_index
-            bpy.ops.object.vertex_group_select()
+        with _paused_item_updates():
+            for item in items:
+                item.selected = True
 
-        if start_mode:
-            bpy.ops.object.mode_set(mode=start_mode)
+        _select_group_vertices(obj, (item.group_index for item in items))
 
-        restore_mode()
+        # Leave the last filtered group active, as selecting one by one did
+        if len(items):
+            obj.vertex_groups.active_index = items[len(items) - 1].group_index
         return {'FINISHED'}
 
 
@@ -291,19 +386,32 @@ class VGFILTER_OT_ReplaceInNames(Operator):
         replacement = props.replacement_text
         pattern = re.compile(re.escape(search), re.IGNORECASE)
 
+        # For ASCII text, plain str methods give the same result as the regex.
+        # Backslashes would be template escapes for re, so those keep using it.
+        search_lower = search.lower()
+        plain_search = search.isascii() and "\\" not in replacement
+
+        # Resolve groups by the name captured at filter time; renaming only
+        # changes names, so this stays valid for the whole loop
+        name_to_vg = {vg.name: vg for vg in obj.vertex_groups}
+
         renamed = 0
         for item in props.filtered_groups:
-            if item.group_index >= len(obj.vertex_groups):
+            vg = name_to_vg.get(item.name)
+            if vg is None:
                 continue
 
-            vg = obj.vertex_groups[item.group_index]
-            if not pattern.search(vg.name):
+            if plain_search and vg.name.isascii():
+                new_name, count = _replace_ascii_ignore_case(vg.name, search_lower, replacement)
+            else:
+                new_name, count = pattern.subn(replacement, vg.name)
+            if count == 0:
                 continue
 
-            new_name = pattern.sub(replacement, vg.name)
             if new_name != vg.name:
                 vg.name = new_name
-                item.name = new_name
+                # Blender may suffix the name to keep it unique; store what it kept
+                item.name = vg.name
                 renamed += 1
 
         if renamed == 0:
@@ -334,73 +442,93 @@ class VGFILTER_OT_SeparateSelected(Operator):
             self.report({'WARNING'}, error)
             return {'CANCELLED'}
 
-        selected_items = [item for item in props.filtered_groups if item.selected]
-        if not selected_items:
+        # Resolve (group name, group index) for every selected item up front
+        vgroups = base_obj.vertex_groups
+        group_count = len(vgroups)
+        jobs = [
+            (vgroups[item.group_index].name, item.group_index)
+            for item in props.filtered_groups
+            if item.selected and item.group_index < group_count
+        ]
+        if not jobs:
             self.report({'INFO'}, "No vertex groups are selected in the list.")
             return {'CANCELLED'}
 
-        separated = 0
-        separated_names = []
-
-        # Work per group to produce one mesh per group
-        for item in selected_items:
-            if item.group_index >= len(base_obj.vertex_groups):
-                continue
+        # Make the base object the only one in Edit Mode so each separation
+        # only affects it. This is the single mode round-trip before the loop.
+        bpy.ops.object.mode_set(mode="OBJECT")
+        bpy.ops.object.select_all(action="DESELECT")
+        base_obj.select_set(True)
+        context.view_layer.objects.active = base_obj
+        bpy.ops.object.mode_set(mode="EDIT")
 
-            vg = base_obj.vertex_groups[item.group_index]
-            target_name = vg.name
+        # Count group members once so empty groups can be skipped without
+        # scanning the mesh again for every group
+        group_vertex_counts = {}
+        bm = bmesh.from_edit_mesh(base_obj.data)
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is not None:
+            for v in bm.verts:
+                for group_index in v[deform_layer].keys():
+                    group_vertex_counts[group_index] = group_vertex_counts.get(group_index, 0) + 1
+
+        # (new object, vertex group name) pairs, finalized in Object Mode
+        separated_objects = []
+
+        # Separating removes the selected geometry and leaves the rest of the
+        # base mesh deselected, so clearing the selection once is enough
+        bpy.ops.mesh.select_all(action="DESELECT")
 
-            # Ensure we are operating on the base object in Edit Mode
-            bpy.ops.object.mode_set(mode="OBJECT")
-            for obj in context.selected_objects:
-                obj.select_set(False)
-            base_obj.select_set(True)
-            context.view_layer.objects.active = base_obj
-            bpy.ops.object.mode_set(mode="EDIT")
+        # Work per group to produce one mesh per group, staying in Edit Mode
+        for target_name, group_index in jobs:
+            # Skip if the group has no vertices
+            if group_vertex_counts.get(group_index, 0) == 0:
+                continue
 
             # Select vertices belonging to this group
-            bpy.ops.mesh.select_all(action="DESELECT")
-            base_obj.vertex_groups.active_index = vg.index
+            vgroups.active_index = group_index
             bpy.ops.object.vertex_group_select()
 
-            # Skip if the group has no vertices
-            bm = bmesh.from_edit_mesh(base_obj.data)
-            if not any(v.select for v in bm.verts):
+            # The counts are taken before any separation, so the group may have
+            # lost all its vertices to an earlier group sharing them
+            if base_obj.data.total_vert_sel == 0:
                 continue
 
-            # Separate the selection to a new object
-            # Track objects before separation to locate the new one reliably
-            pre_objects = {obj.name for obj in context.scene.objects}
-
+            # Separate the selection to a new object. The new object is the
+            # only selected one besides the base object, since earlier results
+            # are deselected as they are collected.
             bpy.ops.mesh.separate(type="SELECTED")
 
-            bpy.ops.object.mode_set(mode="OBJECT")
-            post_objects = {obj.name for obj in context.scene.objects}
-            new_names = post_objects - pre_objects
+            new_obj = next((o for o in context.selected_objects if o != base_obj), None)
+            if new_obj is not None:
+                new_obj.select_set(False)
+                separated_objects.append((new_obj, target_name))
 
-            new_obj = None
-            if new_names:
-                new_obj = context.scene.objects[new_names.pop()]
+        # Rename and clean the new objects in a single Object Mode pass
+        bpy.ops.object.mode_set(mode="OBJECT")
 
-            if new_obj and new_obj != base_obj:
-                if props.rename_separated_meshes:
-                    new_obj.name = target_name
-                    if new_obj.data:
-                        new_obj.data.name = target_name
-                    _clean_vertex_groups(new_obj, keep_name=target_name)
-                else:
-                    _clean_vertex_groups(new_obj)
-                separated += 1
-                separated_names.append(target_name)
+        rename = props.rename_separated_meshes
+        separated = 0
+        separated_names = []
+        for new_obj, target_name in separated_objects:
+            if rename:
+                new_obj.name = target_name
+                if new_obj.data:
+                    new_obj.data.name = target_name
+                _clean_vertex_groups(new_obj, keep_name=target_name)
+            else:
+                _clean_vertex_groups(new_obj)
+            separated += 1
+            separated_names.append(target_name)
 
         # Return to Edit Mode on the base object
-        bpy.ops.object.mode_set(mode="OBJECT")
-        for obj in context.selected_objects:
-            obj.select_set(False)
+        bpy.ops.object.select_all(action="DESELECT")
         base_obj.select_set(True)
 
-        # Clean only the separated groups that no longer have vertices on the original mesh
-        _clean_vertex_groups(base_obj, limit_to=separated_names)
+        # Clean only the separated groups that no longer have vertices on the original mesh.
+        # With nothing separated there is nothing to clean, so skip the mesh scan.
+        if separated_names:
+            _clean_vertex_groups(base_obj, limit_to=frozenset(separated_names))
 
         context.view_layer.objects.active = base_obj
         bpy.ops.object.mode_set(mode="EDIT")
@@ -424,8 +552,8 @@ class VGFILTER_UL_List(UIList):
         if item.selected:
             row.alert = True
 
-        op = row.operator("vgfilter.toggle", text=item.name)
-        op.item_index = index
+        # A plain property toggle; _on_item_selected updates the mesh selection
+        row.prop(item, "selected", text=item.name, toggle=True, emboss=True)
 
 
 # -------------------------------------------------------------